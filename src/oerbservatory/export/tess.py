@@ -1,6 +1,8 @@
 """Demonstrate converting DALIA DIF v1.3 to TeSS."""
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import click
 import pystow
@@ -19,6 +21,10 @@ __all__ = [
     "export_tess",
 ]
 
+#: The number of uploads to run at the same time. TeSS doesn't have an endpoint
+#: for posting several materials at once, so each one is a separate request.
+MAX_UPLOAD_WORKERS = 16
+
 
 def export_tess(oer: EducationalResource) -> LearningMaterial | None:
     """Export from an OERbservatory learning material to a TeSS learning material."""
@@ -102,11 +108,17 @@ def main(test: bool, include_oersi: bool) -> None:
     for func, mtessx_space in functions:
         base_url = "https://test.tesshub.hzdr.de/"
         client = TeSSClient(key="test" if test else mtessx_space, base_url=base_url)
-        resources = func()
-        for resource in tqdm(resources, desc=mtessx_space):
-            tess_resource = export_tess(resource)
-            if tess_resource:
-                client.post(tess_resource, email=email, api_key=api_key)
+        tess_resources = [
+            tess_resource for resource in func() if (tess_resource := export_tess(resource))
+        ]
+        post = partial(client.post, email=email, api_key=api_key)
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            for _ in tqdm(
+                executor.map(post, tess_resources),
+                total=len(tess_resources),
+                desc=mtessx_space,
+            ):
+                pass
 
 
 if __name__ == "__main__":
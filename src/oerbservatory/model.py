@@ -6,26 +6,25 @@ import datetime
 import sqlite3
 import time
 import typing as t
-from collections.abc import Sequence
+from collections.abc import Iterable
 from contextlib import closing
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-import numpy as np
 import orcid_downloader
-import pandas as pd
 import pystow
 import rdflib
-import ssslm
 from curies import Reference
-from pydantic import UUID4, BaseModel, ByteSize, ConfigDict, Field
+from pydantic import UUID4, BaseModel, ByteSize, ConfigDict, Field, TypeAdapter
 from pydantic_extra_types.language_code import ISO639_3, LanguageAlpha2
 from rdflib import URIRef
 from tqdm import tqdm
 
 if TYPE_CHECKING:
+    import numpy as np
+    import ssslm
     from sentence_transformers import SentenceTransformer
 
 __all__ = [
@@ -73,7 +72,14 @@ type Status = t.Literal["Archived", "Published", "Active", "Draft", "Development
 
 
 class EducationalResource(BaseModel):
-    """Represents an educational resource."""
+    """Represents an educational resource.
+
+    The importers in :mod:`oerbservatory.sources` build resources with
+    :meth:`pydantic.BaseModel.model_construct`, which skips validation. This
+    relies on each importer passing values that already have their final types,
+    e.g., because they come from a validated upstream model or were normalized
+    by the importer itself.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -157,18 +163,44 @@ class EducationalResource(BaseModel):
             raise TypeError
 
 
-def write_resources_jsonl(resources: list[EducationalResource], path: Path) -> None:
-    """Write resources as a JSONL file."""
-    with path.open("w") as file:
-        for resource in resources:
-            if not isinstance(resource, BaseModel):
-                raise TypeError(f"should be a model: {type(resource)} {resource}")
-            line = resource.model_dump_json(
+#: A reusable serializer for resources, which writes JSON bytes directly
+RESOURCE_ADAPTER: TypeAdapter[EducationalResource] = TypeAdapter(EducationalResource)
+
+
+#: The buffer size used when writing outputs, large enough to batch many small lines
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_resources_jsonl(
+    resources: Iterable[EducationalResource], path: Path | t.BinaryIO
+) -> None:
+    """Write resources as a JSONL file.
+
+    :param resources: Resources to write. These are written as they're iterated, so
+        a generator can be streamed to disk without keeping all resources in memory.
+    :param path: The path to write to, which is opened with a large write buffer. Or,
+        a file-like object opened in binary mode, which is written to directly.
+    """
+    if isinstance(path, Path):
+        with path.open("wb", buffering=WRITE_BUFFER_SIZE) as file:
+            _write_resources_jsonl(resources, file)
+    else:
+        _write_resources_jsonl(resources, path)
+
+
+def _write_resources_jsonl(resources: Iterable[EducationalResource], file: t.BinaryIO) -> None:
+    for resource in resources:
+        if not isinstance(resource, BaseModel):
+            raise TypeError(f"should be a model: {type(resource)} {resource}")
+        file.write(
+            RESOURCE_ADAPTER.dump_json(
+                resource,
                 exclude_none=True,
                 exclude_defaults=True,
                 exclude_unset=True,
             )
-            file.write(line + "\n")
+        )
+        file.write(b"\n")
 
 
 def prepare_language_model_string(resource: EducationalResource) -> str:
@@ -292,6 +324,7 @@ def _xxx(
     cutoff: float | None = None,
     columns: list[str] | None = None,
 ) -> None:
+    import pandas as pd
     from sklearn.metrics.pairwise import cosine_similarity
 
     index = [r.reference.curie if r.reference else str(r.uuid) for r in resources]
@@ -336,6 +369,7 @@ def write_sqlite_fti(
     resources: list[EducationalResource], path: Path, *, loud: bool = False
 ) -> None:
     """Write a SQLite database with a full text index."""
+    import pandas as pd
     from dalia_dif.dif13.export.fti import _dif13_df_to_sqlite
 
     path.unlink(missing_ok=True)
@@ -378,32 +412,42 @@ def resolve_authors(
     author_names: list[str],
     *,
     organization_grounder: ssslm.Grounder,
-) -> Sequence[Author | Organization]:
+) -> list[Author | Organization]:
     """Get authors."""
-    rv = []
     # wishing for better content in https://github.com/ElixirTeSS/TeSS/issues/1116
-    for author_name in author_names:
-        author_name = author_name.strip()
-        if author_name.lower() in {"unknown", "unknown unknown"}:
-            continue
-
-        author: Author | Organization
-        if "orcid:" in author_name:
-            # this means it's like "Valipour Kahrood, Hossein (orcid: 0000-0003-4166-0382)"
-            name, _, orcid = author_name.partition("(orcid:")
-            name = name.strip()
-            orcid = orcid.strip().strip(")").strip()
-            author = Author(name=name, orcid=orcid)
-        else:
-            matches = orcid_downloader.ground_researcher(author_name)
-            if len(matches) == 1:
-                author = Author(name=matches[0].name, orcid=matches[0].identifier)
-            else:
-                matches = organization_grounder.get_matches(author_name)
-                if len(matches) == 1:
-                    author = Organization(name=matches[0].name, ror=matches[0].identifier)
-                else:
-                    author = Author(name=author_name)
-        rv.append(author)
-
-    return rv
+    return [
+        author
+        for author_name in author_names
+        if (author := _resolve_author(author_name.strip(), organization_grounder)) is not None
+    ]
+
+
+@lru_cache(maxsize=50_000)
+def _resolve_author(
+    author_name: str, organization_grounder: ssslm.Grounder
+) -> Author | Organization | None:
+    """Resolve a single author, which is cached since the same names reoccur across OERs.
+
+    Grounders are hashed by identity, so this is cached separately per grounder. The
+    cache holds a reference to every grounder passed in, which keeps them alive for
+    the life of the process.
+    """
+    if author_name.lower() in {"unknown", "unknown unknown"}:
+        return None
+
+    if "orcid:" in author_name:
+        # this means it's like "Valipour Kahrood, Hossein (orcid: 0000-0003-4166-0382)"
+        name, _, orcid = author_name.partition("(orcid:")
+        name = name.strip()
+        orcid = orcid.strip().strip(")").strip()
+        return Author(name=name, orcid=orcid)
+
+    matches = orcid_downloader.ground_researcher(author_name)
+    if len(matches) == 1:
+        return Author(name=matches[0].name, orcid=matches[0].identifier)
+
+    matches = organization_grounder.get_matches(author_name)
+    if len(matches) == 1:
+        return Organization(name=matches[0].name, ror=matches[0].identifier)
+
+    return Author(name=author_name)
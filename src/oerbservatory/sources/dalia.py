@@ -1,8 +1,9 @@
 """Parse DALIA curation sheets."""
 
 import csv
+import datetime
 import re
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from pathlib import Path
 
 import click
@@ -15,7 +16,8 @@ from dalia_dif.dif13 import (
 )
 from dalia_dif.dif13.picklists import PROFICIENCY_TO_ORDER
 from pydantic import ByteSize
-from pydantic_extra_types.language_code import _index_by_alpha3
+from pydantic_extra_types.language_code import LanguageAlpha2, _index_by_alpha3
+from pydantic_metamodel.api import Year
 from rdflib import URIRef
 from tqdm import tqdm
 
@@ -29,7 +31,7 @@ from oerbservatory.model import (
     write_resources_tfidf,
     write_sqlite_fti,
 )
-from oerbservatory.sources.utils import OUTPUT_DIR, UNSPECIFIED_OR_PROPRIETARY
+from oerbservatory.sources.utils import OUTPUT_DIR, UNSPECIFIED_OR_PROPRIETARY, get_reference
 
 __all__ = [
     "get_dalia",
@@ -42,6 +44,7 @@ ORCID_URI_PREFIX = "https://orcid.org/"
 ROR_URI_PREFIX = "https://ror.org/"
 WIKIDATA_URI_PREFIX = "http://www.wikidata.org/entity/"
 RE = re.compile(r"^(?P<name>.*)\s\((?P<relation>S|R|SR|RS)\)$")
+SIZE_RE = re.compile(r"^(?P<size>[\d.]+)\s*MB$")
 
 
 def _log(path: Path, line: int, text: str) -> None:
@@ -76,26 +79,26 @@ def _process_license(license_uriref: URIRef | None) -> Reference | None | URIRef
     if license_uriref in REMAINING_LICENSES:
         return REMAINING_LICENSES[license_uriref]
     if license_uriref.startswith("http://spdx.org/licenses/"):
-        return Reference(
-            prefix="spdx", identifier=str(license_uriref).removeprefix("http://spdx.org/licenses/")
-        )
+        return get_reference("spdx", str(license_uriref).removeprefix("http://spdx.org/licenses/"))
     raise ValueError(f"unhandled license: {license_uriref}")
 
 
 def map_dalia_oer(dalia_oer: EducationalResourceDIF13) -> EducationalResource | None:
     """Map a DALIA OER to an OERbservatory OER."""
     languages = dalia_oer.languages
-    if languages:
-        language_alpha2 = _index_by_alpha3()[languages[0]].alpha2
-    else:
+    if not languages:
         language_alpha2 = EN
+    elif alpha2 := _index_by_alpha3()[languages[0]].alpha2:
+        language_alpha2 = LanguageAlpha2(alpha2)
+    else:
+        raise ValueError(f"language has no ISO 639-1 code: {languages[0]}")
 
     external_uri, *external_uri_extras = dalia_oer.links
 
-    rv = EducationalResource(
-        reference=Reference(prefix="dalia.oer", identifier=str(dalia_oer.uuid)),
+    rv = EducationalResource.model_construct(
+        reference=get_reference("dalia.oer", str(dalia_oer.uuid)),
         external_uri=external_uri,
-        external_uri_extras=external_uri_extras or None,
+        external_uri_extras=[str(uri) for uri in external_uri_extras] or None,
         title={language_alpha2: dalia_oer.title},
         description={language_alpha2: dalia_oer.description} if dalia_oer.description else None,
         keywords=[{language_alpha2: keyword} for keyword in dalia_oer.keywords],
@@ -103,24 +106,37 @@ def map_dalia_oer(dalia_oer: EducationalResourceDIF13) -> EducationalResource |
         difficulty_level=_get_minimum_proficiency_level(dalia_oer.proficiency_levels),
         languages=languages,
         license=_process_license(dalia_oer.license),
-        file_formats=dalia_oer.file_formats,
-        date_published=dalia_oer.publication_date,
+        file_formats=dalia_oer.file_formats or [],
+        date_published=_process_date(dalia_oer.publication_date),
         version=dalia_oer.version,
-        audience=dalia_oer.target_groups,
+        audience=_uris(dalia_oer.target_groups),
         file_size=_process_size(dalia_oer.file_size),
-        resource_types=dalia_oer.learning_resource_types,
-        media_types=dalia_oer.media_types,
-        disciplines=dalia_oer.disciplines,
+        resource_types=_uris(dalia_oer.learning_resource_types),
+        media_types=_uris(dalia_oer.media_types),
+        disciplines=_uris(dalia_oer.disciplines),
     )
     return rv
 
 
+def _uris(uris: Iterable[URIRef] | None) -> list[URIRef]:
+    return list(uris) if uris else []
+
+
+def _process_date(
+    x: Year | datetime.date | datetime.datetime | None,
+) -> datetime.date | datetime.datetime | None:
+    if isinstance(x, Year):
+        return datetime.date(x, 1, 1)
+    return x
+
+
 def _process_size(x: str | None) -> ByteSize | None:
     if x is None:
         return None
-    if not x.endswith(" MB"):
-        raise ValueError
-    return ByteSize(int(float(x.removesuffix(" MB")) * 1_000_000))
+    match = SIZE_RE.match(x)
+    if match is None:
+        raise ValueError(f"unhandled file size: {x}")
+    return ByteSize(int(float(match.group("size")) * 1_000_000))
 
 
 def _process_author(e: AuthorDIF13 | OrganizationDIF13) -> Author | Organization:
@@ -10,23 +10,29 @@ https://galaxyproject.github.io/training-material/api/.
 
 """
 
+import datetime
 import textwrap
 from collections import Counter
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import click
-import dateutil.parser
 import pystow
-import requests
-from curies import Reference
 from dalia_dif.namespace import HCRT, MODALIA, modalia
-from tabulate import tabulate
+from pydantic_extra_types.language_code import LanguageAlpha2
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from oerbservatory.model import EducationalResource, write_resources_jsonl
+from oerbservatory.model import (
+    EducationalResource,
+    InternationalizedStr,
+    Status,
+    write_resources_jsonl,
+)
+from oerbservatory.sources.utils import get_reference
 
 __all__ = [
     "get_gtn",
@@ -35,8 +41,9 @@ __all__ = [
 MODULE = pystow.module("oerbservatory", "sources", "gtn")
 SITE_BASE = "https://training.galaxyproject.org/training-material"
 
-missing_field_counter: Counter[str] = Counter()
-examples = {}
+#: An example of an unhandled field's value, with the topic and tutorial it came from
+type Example = tuple[Any, str, str]
+
 LEVEL_MAP = {
     "Advanced": MODALIA["Expert"],
     "Beginner": MODALIA["Beginner"],
@@ -50,32 +57,122 @@ def get_gtn(refresh: bool = False) -> list[EducationalResource]:
     return list(iter_gtn(refresh=refresh))
 
 
-def iter_gtn(refresh: bool = False) -> Iterable[EducationalResource]:
+def iter_gtn(
+    refresh: bool = False,
+    *,
+    max_workers: int = 16,
+    missing_field_counter: Counter[str] | None = None,
+    examples: dict[str, Example] | None = None,
+) -> Iterable[EducationalResource]:
     """Iterate over learning materials from GTN."""
-    topics = MODULE.ensure_json(
-        url="https://training.galaxyproject.org/training-material/api/topics.json", force=refresh
-    )
-    for topic in tqdm(topics, desc="Getting GTN topics"):
-        if topic == "admin":
-            continue
-        url = f"https://training.galaxyproject.org/training-material/api/topics/{topic}.json"
-        if False:
-            res = requests.get(url, timeout=30)
-            res.raise_for_status()
-            res_json = res.json()
-        else:
-            res_json = MODULE.ensure_json(url=url)
-        for material in tqdm(res_json["materials"], leave=False, desc=f"GTN: {topic}"):
-            if educational_resource := _process_material(topic, material):
-                yield educational_resource
+    topics = [
+        topic
+        for topic in MODULE.ensure_json(
+            url="https://training.galaxyproject.org/training-material/api/topics.json",
+            force=refresh,
+        )
+        if topic != "admin"
+    ]
+    # downloads are latency bound, so they're done concurrently. Processing is done
+    # serially afterwards, and updates missing_field_counter and examples if given
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, logging_redirect_tqdm():
+        topic_materials = list(
+            tqdm(
+                executor.map(_get_topic_materials, topics),
+                total=len(topics),
+                desc="Getting GTN topics",
+            )
+        )
+        pairs = [
+            (topic, material)
+            for topic, materials in zip(topics, topic_materials, strict=True)
+            for material in materials
+        ]
+        # the same tutorial can be listed more than once in a topic. Download each
+        # only once, so two threads don't write to and read from the same file
+        tutorials = list(
+            dict.fromkeys((topic, material["tutorial_name"]) for topic, material in pairs)
+        )
+        descriptions = dict(
+            zip(
+                tutorials,
+                tqdm(
+                    executor.map(
+                        _get_description,
+                        [topic for topic, _ in tutorials],
+                        [tutorial_name for _, tutorial_name in tutorials],
+                    ),
+                    total=len(tutorials),
+                    unit="tutorial",
+                    desc="Getting GTN tutorials",
+                ),
+                strict=True,
+            )
+        )
+    for topic, material in tqdm(pairs, unit="material", desc="Processing GTN materials"):
+        if educational_resource := _process_material(
+            topic,
+            material,
+            descriptions[topic, material["tutorial_name"]],
+            missing_field_counter=missing_field_counter,
+            examples=examples,
+        ):
+            yield educational_resource
+
+
+def _get_topic_materials(topic: str) -> list[dict[str, Any]]:
+    url = f"https://training.galaxyproject.org/training-material/api/topics/{topic}.json"
+    res_json = MODULE.ensure_json(url=url)
+    return cast(list[dict[str, Any]], res_json["materials"])
+
+
+def _get_description(topic: str, topic_name: str) -> str:
+    """Get the first line of a tutorial's markdown after its front matter."""
+    url = f"https://github.com/galaxyproject/training-material/raw/refs/heads/main/topics/{topic}/tutorials/{topic_name}/tutorial.md"
+    try:
+        path = MODULE.ensure(url=url, name=f"{topic}-{topic_name}-tutorial.md")
+    except pystow.utils.DownloadError:
+        tqdm.write(f"[{topic}-{topic_name}] was not able to download {url}")
+        return ""
+    with path.open(encoding="utf-8") as file:
+        return _get_line_after_front_matter(file)
+
+
+def _get_line_after_front_matter(lines: Iterable[str]) -> str:
+    """Get the first non-blank line after the YAML front matter of a markdown file.
+
+    Lines are consumed lazily, so reading stops as soon as the line is found,
+    rather than reading in the whole file.
+    """
+    markers = 0
+    for line in lines:
+        if line.rstrip() == "---":
+            markers += 1
+        elif markers >= 2 and (stripped := line.strip()):
+            return stripped
+    return ""
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(s: str) -> datetime.datetime:
+    """Parse a date, which GTN almost always gives in ISO 8601 format."""
+    try:
+        return datetime.datetime.fromisoformat(s)
+    except ValueError:
+        import dateutil.parser
+
+        return dateutil.parser.parse(s)
 
 
 def _process_material(  # noqa:C901
     topic: str,
     record: dict[str, Any],
+    description: str,
+    *,
+    missing_field_counter: Counter[str] | None = None,
+    examples: dict[str, Example] | None = None,
 ) -> EducationalResource | None:
     topic_name = record.pop("tutorial_name")
-    url = f"https://github.com/galaxyproject/training-material/raw/refs/heads/main/topics/{topic}/tutorials/{topic_name}/tutorial.md"
 
     for key in [
         "js_requirements",
@@ -90,7 +187,7 @@ def _process_material(  # noqa:C901
     ]:
         record.pop(key, None)
 
-    lang: str = record.pop("lang", "en")
+    lang = LanguageAlpha2(record.pop("lang", "en"))
 
     match record.pop("type"):
         case "tutorial":
@@ -100,22 +197,6 @@ def _process_material(  # noqa:C901
         case x:
             raise ValueError(f"unhandled type: {x}")
 
-    try:
-        if False:
-            res = requests.get(url, timeout=5)
-            text = res.text
-        else:
-            with logging_redirect_tqdm():
-                path = MODULE.ensure(url=url, name=f"{topic}-{topic_name}-tutorial.md")
-            text = path.read_text()
-    except pystow.utils.DownloadError:
-        tqdm.write(f"[{topic}-{topic_name}] was not able to download {url}")
-        description = ""
-    else:
-        rest = text.split("---", 3)[2].strip()
-        index = rest.find("\n")
-        description = rest[:index]
-
     if questions := record.pop("questions", []):
         fmt_text = "\n".join(f"- {question}" for question in questions)
         description += f"\n\nThis tutorial covers the following questions:\n{fmt_text}\n"
@@ -124,23 +205,22 @@ def _process_material(  # noqa:C901
         fmt_text = "\n".join(f"- {key_point}" for key_point in key_points)
         description += f"\n\nThis tutorial covers the key points:\n{fmt_text}\n"
 
+    status: Status
     if record.pop("draft", False):
         status = "Draft"
     else:
         status = "Active"
 
-    xrefs = [
-        Reference(prefix="edam", identifier=edam_id) for edam_id in record.pop("edam_ontology", [])
-    ] or None
+    xrefs = [get_reference("edam", edam_id) for edam_id in record.pop("edam_ontology", [])] or None
 
-    keywords = []
+    keywords: list[InternationalizedStr] = []
     for tag in record.pop("tags", None) or []:
         keywords.append({lang: tag})
     if subtopic := record.pop("subtopic", None):
         keywords.append({lang: subtopic})
 
-    rv = EducationalResource(
-        reference=Reference(prefix="gtn", identifier=record.pop("short_id")),
+    rv = EducationalResource.model_construct(
+        reference=get_reference("gtn", record.pop("short_id")),
         title={lang: record.pop("title")},
         description={lang: description.strip()},
         external_uri=f"{SITE_BASE}{record.pop('url')}",
@@ -148,29 +228,33 @@ def _process_material(  # noqa:C901
         if (objectives := record.pop("objectives", []))
         else None,
         difficulty_level=LEVEL_MAP[level] if (level := record.pop("level", None)) else None,
-        modified=dateutil.parser.parse(modified) if (modified := record.pop("mod_date")) else None,
-        published=dateutil.parser.parse(published)
-        if (published := record.pop("pub_date"))
-        else None,
+        modified=_parse_datetime(modified) if (modified := record.pop("mod_date")) else None,
+        published=_parse_datetime(published) if (published := record.pop("pub_date")) else None,
         version=str(version) if (version := record.pop("version", None)) else None,
         license=record.pop("license", None),
         status=status,
         logo=record.pop("logo", None),
-        resource_types=[resource_type] if resource_type else None,
+        resource_types=[resource_type],
         xrefs=xrefs,
         keywords=keywords or None,
     )
-    for key in record:
-        missing_field_counter[key] += 1
-        if key not in examples and record[key]:
-            examples[key] = record[key], topic, topic_name
+    if missing_field_counter is not None:
+        missing_field_counter.update(record.keys())
+    if examples is not None:
+        for key, value in record.items():
+            if key not in examples and value:
+                examples[key] = value, topic, topic_name
     return rv
 
 
 @click.command()
 def main() -> None:
     """Test processing GTN and make a tabular summary of unhandled fields."""
-    resources = list(iter_gtn())
+    from tabulate import tabulate
+
+    missing_field_counter: Counter[str] = Counter()
+    examples: dict[str, Example] = {}
+    resources = list(iter_gtn(missing_field_counter=missing_field_counter, examples=examples))
     click.echo(
         tabulate(
             [
@@ -1,53 +1,61 @@
 """Ingest OERhub."""
 
-import json
+from __future__ import annotations
+
+import logging
 from collections import Counter
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import click
-import pyobo
+import orjson
 import pystow
-import requests
-import ssslm
 from curies import Reference
 from dalia_dif.namespace import SPDX_LICENSE
 from dalia_dif.utils import cleanup_languages
 from pydantic_extra_types.language_code import LanguageAlpha2
 from rdflib import SDO, URIRef
-from tabulate import tabulate
 from tqdm import tqdm
 
 from oerbservatory.model import (
+    EN,
     EducationalResource,
     InternationalizedStr,
     resolve_authors,
     write_resources_jsonl,
 )
-from oerbservatory.sources.utils import OUTPUT_DIR
+from oerbservatory.sources.utils import OUTPUT_DIR, get_ror_grounder, get_session
+
+if TYPE_CHECKING:
+    import ssslm
 
 __all__ = [
     "get_oerhub",
     "get_oerhub_raw",
 ]
 
+logger = logging.getLogger(__name__)
+
 OERHUB_MODULE = pystow.module("oerbservatory", "sources", "oerhub")
 OERHUB_RAW_PATH = OERHUB_MODULE.join(name="oerhub-raw.json")
 OERHUB_PROCESSED_PATH = OERHUB_MODULE.join(name="oerhub.jsonl")
 OERHUB_TTL_PATH = OUTPUT_DIR.joinpath("oerhub.ttl")
 
+DE = LanguageAlpha2("de")
+#: A non-standard language code used by OERhub, which OERbservatory maps to English
+EN_US_WP = LanguageAlpha2("en_us_wp")
+
 
 def get_oerhub_raw(*, force: bool = False) -> dict[str, Any]:
     """Get OERhub data."""
     if OERHUB_RAW_PATH.is_file() and not force:
-        return cast(dict[str, Any], json.loads(OERHUB_RAW_PATH.read_text()))
+        return cast(dict[str, Any], orjson.loads(OERHUB_RAW_PATH.read_bytes()))
 
     url = "https://oerhub.at/search"
     # there were 3143 on June 20, 2025
     params = {"query": "*", "page": 0, "size": 10000}
-    res = requests.post(url, json=params, timeout=60)
-    data = res.json()
-    with OERHUB_RAW_PATH.open("w") as file:
-        json.dump(data, file, indent=2, ensure_ascii=False)
+    res = get_session().post(url, json=params, timeout=60)
+    data = orjson.loads(res.content)
+    OERHUB_RAW_PATH.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     return cast(dict[str, Any], data)
 
 
@@ -74,13 +82,61 @@ RESOURCE_TYPES = {
 }
 
 
-def get_oerhub(*, organization_grounder: ssslm.Grounder | None = None) -> list[EducationalResource]:  # noqa:C901
-    """Get processed OERs from OERhub."""
+#: Keys in OERhub records' sources that are either mapped or deliberately skipped
+HANDLED_SOURCE_KEYS = frozenset(
+    [
+        "general",
+        "technical",
+        # not sure what this is
+        "oea_valid",
+        # unneeded metadata on when ingestion happened
+        "oea_ingest",
+        "oea_object_direct_link",
+        "oea_title",
+        "oea_title_ml",
+        "oea_classification_00",
+        "oea_classification_01",
+        "oea_classification_02",
+        "oea_classification_03",
+        "oea_classification_05",
+        "oea_classification_06",
+        "rights",
+        "oea_thumbnail_url",
+        "oea_authors",
+    ]
+)
+#: Keys in OERhub records' general sections that are mapped
+HANDLED_GENERAL_KEYS = frozenset(["title", "description", "language", "identifiers"])
+#: Keys in OERhub records' technical sections that are either mapped or deliberately skipped
+HANDLED_TECHNICAL_KEYS = frozenset(
+    [
+        # only applies to video
+        "duration",
+        "thumbnail",
+        "format",
+        "size",
+    ]
+)
+
+
+def get_oerhub(  # noqa:C901
+    *,
+    organization_grounder: ssslm.Grounder | None = None,
+    show_unused_fields: bool = False,
+) -> list[EducationalResource]:
+    """Get processed OERs from OERhub.
+
+    :param organization_grounder: A grounder for organizations. If not given, uses ROR.
+    :param show_unused_fields: Should a table of the fields in the OERhub records
+        that aren't (yet) mapped be shown? This is useful when curating the mapping,
+        but costs an extra pass over all fields of every record.
+    :returns: A list of processed OERs
+    """
     data = get_oerhub_raw()
     hits = data["data"]["hits"]["hits"]
 
     if organization_grounder is None:
-        organization_grounder = pyobo.get_grounder("ror")
+        organization_grounder = get_ror_grounder()
 
     mime_type_counter: Counter[str] = Counter()
     filetype_counter: Counter[str] = Counter()
@@ -89,26 +145,18 @@ def get_oerhub(*, organization_grounder: ssslm.Grounder | None = None) -> list[E
     key_counter: Counter[str] = Counter()
     key_examples = {}
     count = 0
+    missing_license_count = 0
     for record in tqdm(hits, unit="OER", unit_scale=True, desc="Processing OERhub"):
         source = record["_source"]
-        general = source.pop("general")
-        technical = source.pop("technical")
-
-        # only applies to video
-        technical.pop("duration", None)
-        # not sure what this is
-        source.pop("oea_valid", None)
-        # unneeded metadata on when ingestion happened
-        source.pop("oea_ingest", None)
-        # can be reconstructed with references
-        source.pop("oea_object_direct_link", None)
+        general = source["general"]
+        technical = source["technical"]
 
         title: InternationalizedStr | None
         title_1: list[InternationalizedStr] | None = [
-            x for t in general.pop("title", []) if (x := _clean_d(t))
+            x for t in general.get("title", []) if (x := _clean_d(t))
         ] or None
-        title_2: str | None = source.pop("oea_title", None)
-        title_3: InternationalizedStr | None = source.pop("oea_title_ml", None)  # this is a dict
+        title_2: str | None = source.get("oea_title")
+        title_3: InternationalizedStr | None = source.get("oea_title_ml")  # this is a dict
         if title_3:
             title_3 = _clean_d(title_3)
 
@@ -117,50 +165,50 @@ def get_oerhub(*, organization_grounder: ssslm.Grounder | None = None) -> list[E
         elif title_1:
             title = title_1[0]
         elif title_2:
-            title = {LanguageAlpha2("de"): title_2}
+            title = {DE: title_2}
         else:
             continue
 
-        license_classification = source.pop("oea_classification_02").strip()
-        rights = source.pop("rights")
+        license_classification = source["oea_classification_02"].strip()
+        rights = source["rights"]
         if license_classification:
             license = LICENSES[license_classification]
         else:
-            tqdm.write(f"no license classification detected. Rights: {rights}")
+            logger.debug("no license classification detected. Rights: %s", rights)
+            missing_license_count += 1
             license = None  # TODO processs rights?
 
         keywords: list[InternationalizedStr] = [
             {
-                LanguageAlpha2("en"): x["name_en"],
-                LanguageAlpha2("de"): x["name_de"],
+                EN: x["name_en"],
+                DE: x["name_de"],
             }
-            for x in source.pop("oea_classification_01")
+            for x in source["oea_classification_01"]
         ]
 
-        thumbnail_url: str | None = source.pop("oea_thumbnail_url", None)
+        thumbnail_url: str | None = source.get("oea_thumbnail_url")
         # there's also a description available here
-        thumbnail_url_2: str | None = technical.pop("thumbnail", {}).get("url")
+        thumbnail_url_2: str | None = technical.get("thumbnail", {}).get("url")
 
-        descriptions = general.pop("description", [])
+        descriptions = general.get("description", [])
         description = _clean_d(descriptions[0]) if descriptions else None
 
         media_types = []
-        resource_type = source.pop("oea_classification_00")
+        resource_type = source["oea_classification_00"]
         if rr_ := RESOURCE_TYPES[resource_type]:
             media_types.append(rr_)
 
-        direct_link = source.pop("oea_object_direct_link", None)
+        direct_link = source.get("oea_object_direct_link")
         # oea_classification_04 is also resource type?
 
-        mime_type = technical.pop("format")  # unused
+        mime_type = technical["format"]  # unused
         mime_type_counter[mime_type] += 1
-        file_format = source.pop("oea_classification_05")
+        file_format = source["oea_classification_05"]
         if file_format == "unknown":
             file_format = None
         filetype_counter[file_format] += 1
 
-        source.pop("oea_classification_06")
-        languages = cleanup_languages(general.pop("language", []))
+        languages = cleanup_languages(general.get("language", []))
 
         r = EducationalResource(
             platform="oerhub",
@@ -171,41 +219,53 @@ def get_oerhub(*, organization_grounder: ssslm.Grounder | None = None) -> list[E
             description=description,
             languages=languages,
             authors=resolve_authors(
-                source.pop("oea_authors", []), organization_grounder=organization_grounder
+                source.get("oea_authors") or [], organization_grounder=organization_grounder
             ),
             xrefs=[
                 # TODO register all to bioregistry!
                 Reference(prefix=x["catalog"], identifier=x["entry"])
-                for x in general.pop("identifiers")
+                for x in general["identifiers"]
             ],
             logo=thumbnail_url or thumbnail_url_2,
-            date_published=source.pop("oea_classification_03"),
+            date_published=source["oea_classification_03"],
             resource_types=media_types,
-            file_size=technical.pop("size"),
+            file_size=technical["size"],
             file_formats=[file_format] if file_format else [],
         )
 
-        for d in [source, general, technical]:
-            for key, value in d.items():
-                if value:
-                    key_counter[key] += 1
-                    if key not in key_examples:
-                        key_examples[key] = value
+        if show_unused_fields:
+            for d, handled_keys in [
+                (source, HANDLED_SOURCE_KEYS),
+                (general, HANDLED_GENERAL_KEYS),
+                (technical, HANDLED_TECHNICAL_KEYS),
+            ]:
+                for key in d.keys() - handled_keys:
+                    if value := d[key]:
+                        key_counter[key] += 1
+                        if key not in key_examples:
+                            key_examples[key] = value
 
         resources.append(r)
         count += 1
 
     tqdm.write(f"[oerhub] got {count:,} records")
+    if missing_license_count:
+        tqdm.write(f"[oerhub] {missing_license_count:,} records have no license classification")
 
     _echo_counter(mime_type_counter, title="Formats")
     _echo_counter(filetype_counter, title="Filetype")
 
-    rows = [(k, v, key_examples[k]) for k, v in sorted(key_counter.items())]
-    tqdm.write(tabulate(rows, headers=["key", "count", "example"]))
+    if show_unused_fields:
+        from tabulate import tabulate
+
+        rows = [(k, v, key_examples[k]) for k, v in sorted(key_counter.items())]
+        tqdm.write(tabulate(rows, headers=["key", "count", "example"]))
     return resources
 
 
 def _echo_counter(c: Counter[str], title: str | None = None) -> None:
+    from tabulate import tabulate
+
     if title:
         tqdm.write(title)
     tqdm.write(tabulate(c.most_common(), headers=["key", "count"]) + "\n\n")
@@ -215,19 +275,24 @@ def _clean_d(d: InternationalizedStr | None) -> InternationalizedStr | None:
     if d is None:
         return None
     if "en" in d and "en_us_wp" in d:
-        del d[LanguageAlpha2("en_us_wp")]
+        del d[EN_US_WP]
         return d
     if "zxx" in d:  # no linguistic content
         del d["zxx"]  # type:ignore
     if not d:
         return None
-    return {LanguageAlpha2("en") if k == "en_us_wp" else k: v for k, v in d.items()}
+    # most dictionaries don't have this non-standard code, so update in place
+    # rather than building a new dictionary
+    if "en_us_wp" in d:
+        d[EN] = d.pop(EN_US_WP)
+    return d
 
 
 @click.command()
-def main() -> None:
+@click.option("--show-unused-fields", is_flag=True, help="Show fields that aren't mapped yet")
+def main(show_unused_fields: bool) -> None:
     """Process OERhub."""
-    resources = get_oerhub()
+    resources = get_oerhub(show_unused_fields=show_unused_fields)
     write_resources_jsonl(resources, OERHUB_PROCESSED_PATH)
 
 
@@ -1,35 +1,52 @@
 """Process OERSI."""
 
-import json
+import datetime
 from collections.abc import Iterable
 from typing import Any, cast
 
+import click
+import orjson
 import pystow
-from pydantic_extra_types.language_code import _index_by_alpha2
+from pydantic import TypeAdapter
+from pydantic_extra_types.language_code import ISO639_3, _index_by_alpha2
 from rdflib import URIRef
 from tqdm import tqdm
 
-from oerbservatory.model import EducationalResource
+from oerbservatory.model import EN, EducationalResource, write_resources_jsonl
 
 __all__ = [
     "get_oersi",
     "get_oersi_raw",
+    "iter_oersi",
 ]
 
 URL = "https://oersi.org/dumps/oer_data.ndjson.gz"
 MODULE = pystow.module("oerbservatory", "sources", "oersi")
+OERSI_PROCESSED_PATH = MODULE.join(name="oersi.jsonl")
+
+#: Parses publication dates the same way :class:`EducationalResource` would
+DATE_ADAPTER: TypeAdapter[datetime.datetime | datetime.date] = TypeAdapter(
+    datetime.datetime | datetime.date
+)
 
 
 def get_oersi_raw(*, force: bool = False) -> Iterable[dict[str, Any]]:
     """Get OERSI data."""
+    # lines are read as bytes, which orjson parses without decoding them first
     with MODULE.ensure_open_gz(url=URL, force=force) as file:  # type:ignore[call-overload]
         for line in file:
-            yield cast(dict[str, Any], json.loads(line))
+            yield cast(dict[str, Any], orjson.loads(line))
 
 
 def get_oersi(*, force: bool = False) -> list[EducationalResource]:
     """Get processed records from OERSI."""
-    return [_process(record) for record in tqdm(get_oersi_raw(force=force), unit_scale=True)]
+    return list(iter_oersi(force=force))
+
+
+def iter_oersi(*, force: bool = False) -> Iterable[EducationalResource]:
+    """Iterate over processed records from OERSI, without keeping them all in memory."""
+    for record in tqdm(get_oersi_raw(force=force), unit_scale=True):
+        yield _process(record)
 
 
 def _process(record: dict[str, Any]) -> EducationalResource:
@@ -48,7 +65,9 @@ def _process(record: dict[str, Any]) -> EducationalResource:
         for a in record.pop("about", [])
     ]
     description = record.pop("description", None)
-    languages = [_index_by_alpha2()[language].alpha3 for language in record.pop("inLanguage", [])]
+    languages = [
+        ISO639_3(_index_by_alpha2()[language].alpha3) for language in record.pop("inLanguage", [])
+    ]
     resource_types = [
         # TODO standardize
         URIRef(t["id"])  # like https://w3id.org/kim/hcrt/textbook
@@ -64,14 +83,24 @@ def _process(record: dict[str, Any]) -> EducationalResource:
     name = record.pop("name")
     uri = record.pop("id")
 
-    return EducationalResource(
+    return EducationalResource.model_construct(
         platform="oersi",
         external_uri=uri,
-        title={"en": name},
-        description={"en": description} if description else None,
-        date_published=date_published,
+        title={EN: name},
+        description={EN: description} if description else None,
+        date_published=DATE_ADAPTER.validate_python(date_published) if date_published else None,
         audience=audiences,
         resource_types=resource_types,
         disciplines=disciplines,
         languages=languages,
     )
+
+
+@click.command()
+def main() -> None:
+    """Process OERSI."""
+    write_resources_jsonl(iter_oersi(), OERSI_PROCESSED_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,38 @@
 See data dictionaries at https://github.com/ElixirTeSS/TeSS/tree/master/config/dictionaries.
 """
 
+from __future__ import annotations
+
+import operator
+import re
+import threading
 from collections import Counter
-from collections.abc import Sequence
-from functools import lru_cache
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import batched
+from typing import TYPE_CHECKING
 
 import bioregistry
 import click
-import pyobo
 import pystow
-import ssslm
 import tess_downloader
-from curies import NamedReference, Reference, ReferenceTuple
+from curies import Reference, ReferenceTuple
 from dalia_dif.namespace import BIBO, HCRT, MODALIA
 from rdflib import SDO, URIRef
-from tabulate import tabulate
 from tess_downloader import INSTANCES, DifficultyLevel, LearningMaterial, TeSSClient
 from tqdm import tqdm
 
 from oerbservatory.model import EN, Author, EducationalResource, Organization, resolve_authors
-from oerbservatory.sources.utils import TESS_TO_LICENSE
+from oerbservatory.sources.utils import TESS_TO_LICENSE, get_reference, get_ror_grounder
+
+if TYPE_CHECKING:
+    import ssslm
 
 __all__ = [
     "get_single_tess",
     "get_tess",
+    "iter_single_tess",
     "map_tess_oer",
 ]
 
@@ -35,7 +44,7 @@ TESS_LICENSE_DICTIONARY_URL = (
 NO_MATERIALS = {"dresa", "explora"}
 
 OERBSERVATORY_MODULE = pystow.module("oerbservatory", "inputs", "tess")
-RESOURCE_TYPE_MAP: dict[str, URIRef | None] = {
+RESOURCE_TYPE_MAP: dict[str, URIRef] = {
     "video": SDO.VideoObject,
     "series of videos": SDO.VideoObject,
     "youtube video": SDO.VideoObject,
@@ -61,60 +70,65 @@ RESOURCE_TYPE_MAP: dict[str, URIRef | None] = {
     "jupyter notebooks": MODALIA["CodeNotebook"],
     "jupyter notebook": MODALIA["CodeNotebook"],
     #
-    "blog post": None,
-    #
-    "training materials": None,
-    "examples": None,
-    "documentation": None,
-    "bioinformatics": None,
-    "hands-on tutorial": None,
-    "learning pathway": None,
-    "tutorials": None,
-    "handbook": None,
-    "case studies": None,
-    "implementation guidelines": None,
-    "additional reading": None,
-    "didactic activities": None,
-    "mock data": None,
-    "how-to guide": None,
-    "online course": None,
-    "online material": None,
-    "education": None,
-    "open educational resource": None,
-    "tool": None,
-    "toolkit": None,
-    "e-learning + workshop": None,
-    "pdf": None,
-    "recording": None,
-    "r shiny application": None,
-    "free online course": None,
-    "carpentries style curriculum": None,
-    "training materials with mock data": None,
-    "online modules": None,
-    "hackathon": None,
-    "vignette": None,
-    "api reference": None,
-    "educational materials": None,
-    "exercise": None,
-    "handout": None,
-    "workflow": None,
-    "installation instructions": None,
-    "manual": None,
-    "talk": None,
-    "knowledgebase": None,
     "book": BIBO["book"],
-    "notes": None,
-    # Topics
-    "computational biology": None,
-    "computer science": None,
-    "data science": None,
-    "transcriptomics": None,
-    "machine learning": None,
-    # Databases
-    "life sciences literature database": None,
-    "life science literature database": None,
-    "viralzone": None,
 }
+#: Resource types used in TeSS that don't (yet) have a mapping
+IGNORED_RESOURCE_TYPES: frozenset[str] = frozenset(
+    [
+        "blog post",
+        #
+        "training materials",
+        "examples",
+        "documentation",
+        "bioinformatics",
+        "hands-on tutorial",
+        "learning pathway",
+        "tutorials",
+        "handbook",
+        "case studies",
+        "implementation guidelines",
+        "additional reading",
+        "didactic activities",
+        "mock data",
+        "how-to guide",
+        "online course",
+        "online material",
+        "education",
+        "open educational resource",
+        "tool",
+        "toolkit",
+        "e-learning + workshop",
+        "pdf",
+        "recording",
+        "r shiny application",
+        "free online course",
+        "carpentries style curriculum",
+        "training materials with mock data",
+        "online modules",
+        "hackathon",
+        "vignette",
+        "api reference",
+        "educational materials",
+        "exercise",
+        "handout",
+        "workflow",
+        "installation instructions",
+        "manual",
+        "talk",
+        "knowledgebase",
+        "notes",
+        # Topics
+        "computational biology",
+        "computer science",
+        "data science",
+        "transcriptomics",
+        "machine learning",
+        # Databases
+        "life sciences literature database",
+        "life science literature database",
+        "viralzone",
+    ]
+)
 DIFFICULTY_LEVEL_MAP: dict[DifficultyLevel, URIRef | None] = {
     "advanced": MODALIA["Expert"],
     "beginner": MODALIA["Beginner"],
@@ -122,14 +136,67 @@ DIFFICULTY_LEVEL_MAP: dict[DifficultyLevel, URIRef | None] = {
     "notspecified": None,
 }
 
-unknown_resource_type: Counter[str] = Counter()
+
+class _SafeCounter:
+    """A counter that can be updated from several threads."""
+
+    def __init__(self) -> None:
+        self._counter: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, key: str) -> bool:
+        """Count the key, and return if it's the first time it's been seen."""
+        with self._lock:
+            new = key not in self._counter
+            self._counter[key] += 1
+        return new
+
+    def update(self, counter: Counter[str]) -> list[str]:
+        """Add counts from another counter, and return the keys that weren't seen before."""
+        with self._lock:
+            new = [key for key in counter if key not in self._counter]
+            self._counter.update(counter)
+        return new
+
+    def snapshot(self) -> Counter[str]:
+        """Get a copy of the counts so far."""
+        with self._lock:
+            return self._counter.copy()
+
+
+#: Resource types seen in TeSS that are neither mapped nor ignored. This is
+#: thread-safe, so materials can be mapped from several threads.
+unknown_resource_type = _SafeCounter()
+
+
+#: Matches a DOI resolver prefix, which TeSS sometimes includes in DOIs
+DOI_PREFIX_RE = re.compile(r"^https?://doi\.org/")
+
+#: Gets the fields of a material that are mapped directly, in a single call
+_get_material_fields = operator.attrgetter(
+    "doi",
+    "title",
+    "description",
+    "keywords",
+    "date_published",
+    "prerequisites",
+    "learning_objectives",
+)
+
+#: The number of materials sent to a worker process at a time
+MATERIALS_CHUNK_SIZE = 500
 
 
 @lru_cache(1)
 def get_key_to_license_uri() -> dict[str, URIRef]:
     """Get a dictionary from key to license URI based on TeSS's configuration."""
+    import yaml
+
     rv = {}
-    records = OERBSERVATORY_MODULE.ensure_yaml(url=TESS_LICENSE_DICTIONARY_URL)
+    path = OERBSERVATORY_MODULE.ensure(url=TESS_LICENSE_DICTIONARY_URL)
+    with path.open(encoding="utf-8") as file:
+        # use libyaml's parser when available, which is much faster than pure Python
+        records = yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))  # noqa:S506
     for key, record in records.items():
         if key in TESS_TO_LICENSE:
             rv[key] = TESS_TO_LICENSE[key]
@@ -141,31 +208,33 @@ def get_key_to_license_uri() -> dict[str, URIRef]:
     return rv
 
 
-def _get_resource_types(attributes: LearningMaterial) -> list[URIRef]:
+def _get_resource_types(attributes: LearningMaterial, *, warn: bool = True) -> list[URIRef]:
     rv = []
     for resource_type in attributes.resource_type or []:
-        resource_type = resource_type.lower().strip()
-        nn = RESOURCE_TYPE_MAP.get(resource_type)
-        if nn:
-            rv.append(nn)
-        else:
-            if not unknown_resource_type[resource_type]:
-                tqdm.write(click.style(f'"{resource_type}": None,', fg="red"))
-            unknown_resource_type[resource_type] += 1
+        # most resource types are already normalized, so only normalize on a miss
+        if resource_type not in RESOURCE_TYPE_MAP and resource_type not in IGNORED_RESOURCE_TYPES:
+            resource_type = resource_type.lower().strip()
+        if uri := RESOURCE_TYPE_MAP.get(resource_type):
+            rv.append(uri)
+        elif resource_type in IGNORED_RESOURCE_TYPES:
+            continue
+        elif unknown_resource_type.add(resource_type) and warn:
+            _warn_unknown_resource_type(resource_type)
     return rv
 
 
-def _get_difficulty_levels(oer: tess_downloader.LearningMaterial) -> list[URIRef] | None:
-    if oer.difficulty_level is None or oer.difficulty_level == "notspecified":
-        return None
-    if difficulty_level := DIFFICULTY_LEVEL_MAP.get(oer.difficulty_level):
-        return [difficulty_level]
-    return None
+def _warn_unknown_resource_type(resource_type: str) -> None:
+    tqdm.write(click.style(f'"{resource_type}",', fg="red"))
+
+
+def _get_difficulty_level(oer: tess_downloader.LearningMaterial) -> URIRef | None:
+    # "notspecified" maps to None, so it doesn't need to be checked separately
+    return DIFFICULTY_LEVEL_MAP.get(oer.difficulty_level) if oer.difficulty_level else None
 
 
 def _get_authors(
     attributes: LearningMaterial, organization_grounder: ssslm.Grounder
-) -> Sequence[Author | Organization]:
+) -> list[Author | Organization]:
     return resolve_authors(attributes.authors or [], organization_grounder=organization_grounder)
 
 
@@ -174,33 +243,37 @@ def map_tess_oer(
     material_wrapper: tess_downloader.LearningMaterialWrapper,
     *,
     organization_grounder: ssslm.Grounder,
+    warn: bool = True,
 ) -> EducationalResource | None:
     """Map a TeSS OER to an OERbservatory OER."""
     material = material_wrapper.attributes
-    doi = material.doi
+    doi, title, description, keywords, date_published, prerequisites, learning_objectives = (
+        _get_material_fields(material)
+    )
     if doi:
-        if not doi.strip() or " " in doi:
+        if " " in doi:
             doi = None
-        else:
-            doi = doi.removeprefix("https://doi.org/").removeprefix("http://doi.org/").strip()
+        elif doi := DOI_PREFIX_RE.sub("", doi, count=1).strip():
             doi = f"https://doi.org/{doi}"
+        else:
+            doi = None
 
-    reference = Reference(prefix=f"tess.{client.key}", identifier=str(material_wrapper.id))
+    reference = get_reference(f"tess.{client.key}", str(material_wrapper.id))
 
-    educational_resource = EducationalResource(
+    educational_resource = EducationalResource.model_construct(
         reference=reference,
         external_uri=doi,
-        title={EN: material.title.strip()},
+        title={EN: title.strip()},
         license=_get_license(material),
-        description={EN: material.description.strip()},
-        keywords=[{EN: kw.strip()} for kw in material.keywords or []],
+        description={EN: description.strip()},
+        keywords=[{EN: kw} for kw in map(str.strip, keywords or []) if kw],
         xrefs=_get_xrefs(material),
-        date_published=material.date_published,
-        resource_types=_get_resource_types(material),
-        difficulty_level=_get_difficulty_levels(material),
+        date_published=date_published,
+        resource_types=_get_resource_types(material, warn=warn),
+        difficulty_level=_get_difficulty_level(material),
         authors=_get_authors(material, organization_grounder=organization_grounder),
-        prerequisites=material.prerequisites,
-        learning_objectives=material.learning_objectives,
+        prerequisites=prerequisites,
+        learning_objectives=learning_objectives,
     )
     return educational_resource
 
@@ -209,38 +282,123 @@ def get_single_tess(
     client: TeSSClient,
     *,
     organization_grounder: ssslm.Grounder | None = None,
+    processes: int = 0,
 ) -> list[EducationalResource]:
     """Get a TeSS graph."""
-    if organization_grounder is None:
-        organization_grounder = pyobo.get_grounder("ror")
+    rv = list(
+        iter_single_tess(client, organization_grounder=organization_grounder, processes=processes)
+    )
+    tqdm.write(f"[tess.{client.key}] created {len(rv):,} records")
+    return rv
+
 
+def iter_single_tess(
+    client: TeSSClient,
+    *,
+    organization_grounder: ssslm.Grounder | None = None,
+    processes: int = 0,
+) -> Iterable[EducationalResource]:
+    """Iterate over processed OERs from a TeSS instance, mapping each as it's consumed."""
+    # this isn't a generator, so invalid arguments fail on the call, not on first use
+    _check_processes(processes, organization_grounder)
+    return _map_materials(
+        client,
+        _get_materials(client),
+        organization_grounder=organization_grounder,
+        processes=processes,
+    )
+
+
+def _check_processes(processes: int, organization_grounder: ssslm.Grounder | None) -> None:
+    if processes < 0:
+        raise ValueError(f"number of processes can't be negative: {processes}")
+    if processes and organization_grounder is not None:
+        raise ValueError("a custom organization grounder can't be used with worker processes")
+
+
+def _get_materials(client: TeSSClient) -> list[tess_downloader.LearningMaterialWrapper]:
+    # tess_downloader caches the materials on disk after the first download. Delete
+    # the client's raw pystow module to get fresh data
     try:
-        materials = client.get_materials()
+        return client.get_materials()
     except ValueError as e:
         tqdm.write(f"[tess.{client.key}] failed: {e}")
         raise
 
+
+def _map_materials(
+    client: TeSSClient,
+    materials: list[tess_downloader.LearningMaterialWrapper],
+    *,
+    organization_grounder: ssslm.Grounder | None = None,
+    processes: int = 0,
+) -> Iterable[EducationalResource]:
+    if processes:
+        # load the license dictionary before starting workers, so they don't race
+        # to download it. Forked workers inherit the cache, and spawned ones read
+        # the file from disk
+        get_key_to_license_uri()
+        # grounding authors is CPU bound, so map chunks of materials in workers.
+        # Each loads its own ROR and ORCID grounders, so memory grows with processes
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker) as executor:
+            for resources, unknown in executor.map(
+                partial(_map_tess_chunk, client), batched(materials, MATERIALS_CHUNK_SIZE)
+            ):
+                for resource_type in unknown_resource_type.update(unknown):
+                    _warn_unknown_resource_type(resource_type)
+                yield from resources
+        return
+
+    if organization_grounder is None:
+        organization_grounder = get_ror_grounder()
+
+    for material in materials:
+        if educational_resource := map_tess_oer(
+            client, material, organization_grounder=organization_grounder
+        ):
+            yield educational_resource
+
+
+def _init_worker() -> None:
+    """Load the grounders once in a worker process, rather than on its first material."""
+    from orcid_downloader.lexical import get_orcid_grounder
+
+    get_ror_grounder()
+    get_orcid_grounder()
+    get_key_to_license_uri()
+
+
+def _map_tess_chunk(
+    client: TeSSClient, materials: Sequence[tess_downloader.LearningMaterialWrapper]
+) -> tuple[list[EducationalResource], Counter[str]]:
+    """Map materials in a worker process.
+
+    The grounders were already loaded by the pool's initializer. The unknown resource
+    types seen while mapping are returned rather than warned about, since the worker's
+    counter isn't shared, so the parent warns about each one only once.
+    """
+    organization_grounder = get_ror_grounder()
+    before = unknown_resource_type.snapshot()
     rv = [
         educational_resource
         for material in materials
         if (
             educational_resource := map_tess_oer(
-                client, material, organization_grounder=organization_grounder
+                client, material, organization_grounder=organization_grounder, warn=False
             )
         )
     ]
-    tqdm.write(f"[tess.{client.key}] created {len(rv):,} records")
-    return rv
+    return rv, unknown_resource_type.snapshot() - before
 
 
-def _get_xrefs(material: tess_downloader.LearningMaterial) -> list[NamedReference] | None:
+def _get_xrefs(material: tess_downloader.LearningMaterial) -> list[Reference] | None:
     if not material.scientific_topics:
         return None
-    rv: list[NamedReference] = []
+    rv: list[Reference] = []
     for t in material.scientific_topics:
         r: ReferenceTuple | None = bioregistry.get_default_converter().parse_uri(t.uri)
         if r:
-            rv.append(r.to_pydantic(t.preferred_label))
+            rv.append(r.to_pydantic(name=t.preferred_label))
     return rv
 
 
@@ -250,31 +408,60 @@ def _get_license(attributes: LearningMaterial) -> URIRef | str | None:
     return get_key_to_license_uri()[attributes.license]
 
 
+@lru_cache
+def _get_client(key: str) -> TeSSClient:
+    """Get a client for a known TeSS instance, which is created once per process."""
+    return TeSSClient(key=key)
+
+
 def get_tess(
     *,
     organization_grounder: ssslm.Grounder | None = None,
+    processes: int = 0,
 ) -> list[EducationalResource]:
     """Get processed OERs from all known TeSS instances."""
-    if organization_grounder is None:
-        organization_grounder = pyobo.get_grounder("ror")
+    _check_processes(processes, organization_grounder)
+    clients = [_get_client(key) for key in INSTANCES]
+    # downloading is latency bound, so it's done concurrently. Mapping is CPU bound
+    # and lazily loads the license dictionary and grounders, so it's done afterwards
+    with ThreadPoolExecutor(max_workers=min(8, len(clients))) as executor:
+        client_materials = list(
+            tqdm(
+                executor.map(_get_materials, clients),
+                total=len(clients),
+                unit="instance",
+                desc="[tess] downloading",
+            )
+        )
     resources = []
-    for key in tqdm(INSTANCES, unit="instance", desc="[tess] processing"):
-        client = TeSSClient(key=key)
-        resources.extend(
-            get_single_tess(
-                client=client,
+    for client, materials in zip(clients, client_materials, strict=True):
+        rv = list(
+            _map_materials(
+                client,
+                materials,
                 organization_grounder=organization_grounder,
+                processes=processes,
             )
         )
+        tqdm.write(f"[tess.{client.key}] created {len(rv):,} records")
+        resources.extend(rv)
     return resources
 
 
 @click.command()
-def main() -> None:
+@click.option(
+    "--processes",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Map materials in this many worker processes, or serially if 0",
+)
+def main(processes: int) -> None:
     """Convert TeSS to DALIA."""
-    organization_grounder = pyobo.get_grounder("ror")
-    get_tess(organization_grounder=organization_grounder)
-    click.echo(tabulate(unknown_resource_type.most_common()))
+    from tabulate import tabulate
+
+    get_tess(processes=processes)
+    click.echo(tabulate(unknown_resource_type.snapshot().most_common()))
 
 
 if __name__ == "__main__":
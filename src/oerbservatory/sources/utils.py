@@ -1,17 +1,26 @@
 """Utilities and constants."""
 
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
-__all__ = ["OUTPUT_DIR"]
+__all__ = ["OUTPUT_DIR", "get_reference", "get_ror_grounder", "get_session"]
 
+from curies import Prefix, Reference
 from rdflib import Namespace, URIRef
 
+if TYPE_CHECKING:
+    import requests
+    import ssslm
+
 HERE = Path(__file__).parent.resolve()
 ROOT = HERE.parent.parent.parent.resolve()
 OUTPUT_DIR = ROOT.joinpath("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-
 LICENSE_ONT = Namespace("https://w3id.org/license-ontology/")
 UNSPECIFIED_OR_PROPRIETARY = LICENSE_ONT["unspecified"]
 TESS_TO_LICENSE: dict[str, URIRef] = {
@@ -22,3 +31,46 @@ TESS_TO_LICENSE: dict[str, URIRef] = {
     "other-nc": LICENSE_ONT["non-commercial"],  # not commercial
     "other-pd": LICENSE_ONT["public-domain"],  # public domain
 }
+
+
+@lru_cache(1)
+def get_session() -> requests.Session:
+    """Get a shared HTTP session, so connections are kept alive and reused across requests."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                # the OERhub search endpoint is queried with POST, but it's idempotent
+                allowed_methods=frozenset({"GET", "POST"}),
+            ),
+        ),
+    )
+    return session
+
+
+@lru_cache(1)
+def get_ror_grounder() -> ssslm.Grounder:
+    """Get a grounder for organizations in ROR, which is loaded once per process."""
+    import pyobo
+
+    return pyobo.get_grounder("ror")
+
+
+@lru_cache(maxsize=16_384)
+def get_reference(prefix: str, identifier: str) -> Reference:
+    """Get a reference from a trusted prefix and identifier, without validation.
+
+    References are frozen, so the same instance is shared for repeated pairs, such as
+    EDAM topics and SPDX licenses, which reoccur across many resources.
+    """
+    return Reference.model_construct(prefix=cast(Prefix, sys.intern(prefix)), identifier=identifier)
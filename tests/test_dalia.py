@@ -0,0 +1,27 @@
+"""Tests for ingesting DALIA."""
+
+import datetime
+import unittest
+
+from pydantic_metamodel.api import Year
+
+from oerbservatory.sources import dalia
+
+
+class TestDALIA(unittest.TestCase):
+    """Test mapping DALIA records."""
+
+    def test_process_date(self) -> None:
+        """Test processing publication dates."""
+        self.assertIsNone(dalia._process_date(None))
+        self.assertEqual(datetime.date(2021, 1, 1), dalia._process_date(Year(2021)))
+        date = datetime.date(2021, 5, 6)
+        self.assertEqual(date, dalia._process_date(date))
+
+    def test_process_size(self) -> None:
+        """Test processing file sizes."""
+        self.assertIsNone(dalia._process_size(None))
+        self.assertEqual(1_500_000, dalia._process_size("1.5 MB"))
+        self.assertEqual(2_000_000, dalia._process_size("2MB"))
+        with self.assertRaises(ValueError):
+            dalia._process_size("2 GB")
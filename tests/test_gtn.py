@@ -0,0 +1,86 @@
+"""Tests for ingesting GTN."""
+
+import datetime
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from oerbservatory.sources import gtn
+
+TUTORIAL_MARKDOWN = (
+    "---\nlayout: tutorial_hands_on\ntitle: Title\n---\n\nThe first line.\nMore text\n"
+)
+
+
+class FakeModule:
+    """A stand-in for GTN's pystow module that serves records without downloading."""
+
+    def __init__(self, directory: Path, materials: list[dict[str, Any]]) -> None:
+        """Initialize the fake module."""
+        self.directory = directory
+        self.materials = materials
+        self.ensure_counter: Counter[str] = Counter()
+
+    def ensure_json(self, url: str, force: bool = False) -> Any:
+        """Get the topics, or the materials for the single topic."""
+        if url.endswith("/topics.json"):
+            return ["admin", "assembly"]
+        return {"materials": [dict(material) for material in self.materials]}
+
+    def ensure(self, url: str, name: str) -> Path:
+        """Write a tutorial's markdown and count how often it was requested."""
+        self.ensure_counter[name] += 1
+        path = self.directory.joinpath(name)
+        path.write_text(TUTORIAL_MARKDOWN)
+        return path
+
+
+def _material(short_id: str, tutorial_name: str) -> dict[str, Any]:
+    return {
+        "tutorial_name": tutorial_name,
+        "type": "tutorial",
+        "short_id": short_id,
+        "title": "Title",
+        "url": f"/topics/assembly/tutorials/{tutorial_name}/tutorial.html",
+        "mod_date": "2024-01-02",
+        "pub_date": "2023-05-06",
+    }
+
+
+class TestGTN(unittest.TestCase):
+    """Test ingesting GTN."""
+
+    def test_repeated_tutorial(self) -> None:
+        """Test a tutorial that's listed twice in a topic is only downloaded once."""
+        materials = [
+            _material("T00331", "largegenome"),
+            _material("T00331", "largegenome"),
+            _material("T00332", "smallgenome"),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            module = FakeModule(Path(directory), materials)
+            with mock.patch.object(gtn, "MODULE", module):
+                resources = list(gtn.iter_gtn(max_workers=4))
+
+        self.assertEqual(
+            {"assembly-largegenome-tutorial.md": 1, "assembly-smallgenome-tutorial.md": 1},
+            dict(module.ensure_counter),
+        )
+        self.assertEqual(3, len(resources))
+        for resource in resources:
+            self.assertEqual({"en": "The first line."}, resource.description)
+
+    def test_get_line_after_front_matter(self) -> None:
+        """Test getting the first line after a markdown file's front matter."""
+        lines = TUTORIAL_MARKDOWN.splitlines(keepends=True)
+        self.assertEqual("The first line.", gtn._get_line_after_front_matter(lines))
+        self.assertEqual("", gtn._get_line_after_front_matter(["---\n", "title: x\n"]))
+
+    def test_parse_datetime(self) -> None:
+        """Test parsing dates in ISO 8601 and other formats."""
+        expected = datetime.datetime(2024, 1, 2)
+        self.assertEqual(expected, gtn._parse_datetime("2024-01-02"))
+        self.assertEqual(expected, gtn._parse_datetime("January 2, 2024"))
@@ -0,0 +1,22 @@
+"""Tests for ingesting OERhub."""
+
+import unittest
+
+from oerbservatory.sources import oerhub
+
+
+class TestOERhub(unittest.TestCase):
+    """Test mapping OERhub records."""
+
+    def test_clean_d(self) -> None:
+        """Test cleaning internationalized strings."""
+        for d, expected in [
+            (None, None),
+            ({"zxx": "?"}, None),
+            ({"de": "Titel", "zxx": "?"}, {"de": "Titel"}),
+            ({"en_us_wp": "Title"}, {"en": "Title"}),
+            ({"en": "Title", "en_us_wp": "Other"}, {"en": "Title"}),
+            ({"de": "Titel"}, {"de": "Titel"}),
+        ]:
+            with self.subTest(d=d):
+                self.assertEqual(expected, oerhub._clean_d(d))
@@ -0,0 +1,72 @@
+"""Tests for ingesting TeSS."""
+
+import unittest
+from typing import Any
+from unittest import mock
+
+import tess_downloader
+from curies import Reference
+from dalia_dif.namespace import MODALIA
+from tess_downloader import TeSSClient
+
+from oerbservatory.sources import tess
+
+EDAM_BIOLOGY = tess_downloader.Topic(
+    preferred_label="Biology", uri="http://edamontology.org/topic_3070"
+)
+
+
+def _material(**kwargs: Any) -> tess_downloader.LearningMaterial:
+    return tess_downloader.LearningMaterial(
+        title="Title", url="https://example.org", description="Description", **kwargs
+    )
+
+
+class TestTeSS(unittest.TestCase):
+    """Test mapping TeSS materials."""
+
+    def map_material(self, material: tess_downloader.LearningMaterial) -> Any:
+        """Map a material without loading licenses or grounding authors."""
+        wrapper = tess_downloader.LearningMaterialWrapper(id="1", attributes=material)
+        with (
+            mock.patch.object(tess, "get_key_to_license_uri", return_value={}),
+            mock.patch.object(tess, "resolve_authors", return_value=[]),
+        ):
+            return tess.map_tess_oer(
+                TeSSClient(key="tess"), wrapper, organization_grounder=mock.Mock()
+            )
+
+    def test_difficulty_level(self) -> None:
+        """Test mapping difficulty levels."""
+        for difficulty_level, expected in [
+            ("beginner", MODALIA["Beginner"]),
+            ("intermediate", MODALIA["Competent"]),
+            ("advanced", MODALIA["Expert"]),
+            ("notspecified", None),
+        ]:
+            with self.subTest(difficulty_level=difficulty_level):
+                material = _material(difficulty_level=difficulty_level)
+                self.assertEqual(expected, tess._get_difficulty_level(material))
+
+    def test_xrefs(self) -> None:
+        """Test mapping scientific topics to references."""
+        self.assertIsNone(tess._get_xrefs(_material()))
+        self.assertEqual(
+            [Reference(prefix="edam.topic", identifier="3070")],
+            tess._get_xrefs(_material(scientific_topics=[EDAM_BIOLOGY])),
+        )
+
+    def test_doi(self) -> None:
+        """Test normalizing DOIs."""
+        for doi, expected in [
+            ("10.1/x", "https://doi.org/10.1/x"),
+            ("https://doi.org/10.1/x", "https://doi.org/10.1/x"),
+            ("http://doi.org/10.1/x", "https://doi.org/10.1/x"),
+            ("https://doi.org/", None),
+            ("10.1/x and more", None),
+            ("10.1/x ", None),
+            (None, None),
+        ]:
+            with self.subTest(doi=doi):
+                resource = self.map_material(_material(doi=doi))
+                self.assertEqual(expected, resource.external_uri)